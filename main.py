@@ -1,65 +1,223 @@
-import webview
+import functools
+import hashlib
 import json
+import logging
+import logging.handlers
 import os
 import subprocess
 import sys
-import mimetypes
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-# Fix MIME types for ES6 modules
-mimetypes.add_type('application/javascript', '.ts')
-mimetypes.add_type('application/javascript', '.tsx')
+# Engine log lines are buffered and written in batches so console I/O never stalls a JS bridge call;
+# warnings and errors flush the buffer immediately
+logger = logging.getLogger('netconnect')
+if not logger.handlers:
+    _console = logging.StreamHandler()
+    _console.setFormatter(logging.Formatter('[Engine] %(message)s'))
+    logger.addHandler(logging.handlers.MemoryHandler(1024, flushLevel=logging.WARNING, target=_console))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
 
 CONFIG_FILE = Path.home() / ".netconnect_pro.json"
+# Plain-string form for the os.* calls on the hot IPC paths
+CONFIG_FILE_STR = os.fspath(CONFIG_FILE)
+# Bundled UI location (PyInstaller unpacks into sys._MEIPASS)
+TEMPLATE_DIR = getattr(sys, '_MEIPASS', None) or os.path.dirname(os.path.abspath(__file__))
+INDEX_PATH = os.path.join(TEMPLATE_DIR, 'index.html')
+# Config/export files are written in one chunk, so one buffer covers a typical file
+IO_BUFFER_SIZE = 128 * 1024
+
+# Candidate install locations per VPN client, in probe order
+_VPN_BINARIES = {
+    "FortiClient": {
+        "cli": (
+            r"C:\Program Files\Fortinet\FortiClient\FortiSSLVPNcli.exe",
+            r"C:\Program Files (x86)\Fortinet\FortiClient\FortiSSLVPNcli.exe",
+        ),
+        "gui": (r"C:\Program Files\Fortinet\FortiClient\FortiClient.exe",),
+    },
+    "OpenVPN": {
+        "gui": (r"C:\Program Files\OpenVPN\bin\openvpn-gui.exe",),
+    },
+    "Palo Alto GlobalProtect": {
+        "gui": (r"C:\Program Files\Palo Alto Networks\GlobalProtect\PanGPA.exe",),
+    },
+    "Cisco AnyConnect": {
+        "gui": (
+            r"C:\Program Files (x86)\Cisco\Cisco AnyConnect Secure Mobility Client\vpnui.exe",
+            r"C:\Program Files (x86)\Cisco\Cisco Secure Client\vpnui.exe",
+        ),
+    },
+    "Citrix": {
+        "gui": (r"C:\Program Files (x86)\Citrix\ICA Client\SelfServicePlugin\SelfService.exe",),
+    },
+}
+
+# Launch options that detach a client from our stdio and inherited handles so it outlives the app
+_DETACHED = dict(close_fds=True, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+if sys.platform == 'win32':
+    _DETACHED['creationflags'] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+
+# Keeps short-lived helper tools from flashing a console window
+_NO_WINDOW = {'creationflags': subprocess.CREATE_NO_WINDOW} if sys.platform == 'win32' else {}
+
+def _atomic_write(path, data):
+    """Writes bytes to a unique sibling temp file and renames it over path, so a crash never leaves a torn file.
+
+    Returns the written file's stat, taken before the rename (which keeps mtime and size), so it
+    describes these bytes even if another writer replaces path right afterwards.
+    """
+    path = os.fspath(path)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or None, prefix=f"{os.path.basename(path)}.", suffix='.tmp')
+    try:
+        with open(fd, 'wb', buffering=IO_BUFFER_SIZE) as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+            st = os.fstat(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    return st
+
+def _get_webview():
+    """Imports pywebview on first use so NetConnectAPI stays importable without the GUI stack."""
+    import webview
+    return webview
+
+@functools.lru_cache(maxsize=None)
+def _resolve(protocol):
+    """Returns the first installed binary for each client role, probing the disk once per protocol."""
+    candidates = _VPN_BINARIES.get(protocol, {})
+    return {role: next((p for p in paths if os.path.exists(p)), None) for role, paths in candidates.items()}
 
 class NetConnectAPI:
+    _JSON_FILETYPES = ('JSON Files (*.json)',)
+
     def __init__(self):
         self._window = None
+        self._cache = None
+        self._cache_parsed = None
+        self._cache_stat = None
+        self._last_saved_digest = None
+        self._last_saved_stat = None
+        # pywebview runs each js_api call on its own thread and the UI fires saves without awaiting them
+        self._lock = threading.RLock()
+        # Client launches run here so cmdkey/Popen latency never blocks the JS bridge thread
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="netconnect")
+        self._handlers = {
+            "FortiClient": self._run_forticlient,
+            "OpenVPN": self._run_openvpn,
+            "Palo Alto GlobalProtect": self._run_gui_client,
+            "Cisco AnyConnect": self._run_gui_client,
+            "Citrix": self._run_gui_client,
+        }
 
     def set_window(self, window):
         self._window = window
 
     def load_config(self):
         """Loads the configuration file from the user's home directory."""
-        if os.path.exists(CONFIG_FILE):
+        with self._lock:
             try:
-                with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    print(f"[Engine] Config loaded from {CONFIG_FILE}")
-                    return content
+                st = os.stat(CONFIG_FILE_STR)
+                stamp = (st.st_mtime_ns, st.st_size)
+                if stamp == self._cache_stat:
+                    return self._cache
+                content = CONFIG_FILE.read_bytes().decode('utf-8')
+                self._cache = content
+                self._cache_parsed = None
+                self._cache_stat = stamp
+                logger.info("Config loaded from %s", CONFIG_FILE)
+                return content
+            except FileNotFoundError:
+                logger.info("No config file found at %s", CONFIG_FILE)
+                return None
             except Exception as e:
-                print(f"[Engine] Error loading config: {e}")
+                logger.error("Error loading config: %s", e)
                 return None
-        print(f"[Engine] No config file found at {CONFIG_FILE}")
-        return None
+
+    def get_parsed_config(self):
+        """Returns the config as a dict, parsing the cached file content at most once per change."""
+        with self._lock:
+            content = self.load_config()
+            if content is None:
+                return None
+            if self._cache_parsed is None:
+                try:
+                    self._cache_parsed = json.loads(content)
+                except ValueError as e:
+                    logger.error("Config is not valid JSON: %s", e)
+                    return None
+            return self._cache_parsed
+
+    def _invalidate_cache(self):
+        with self._lock:
+            self._cache = None
+            self._cache_parsed = None
+            self._cache_stat = None
+            self._last_saved_digest = None
+            self._last_saved_stat = None
 
     def save_config(self, config_json):
         """Saves the current configuration to the user's home directory."""
         if not config_json or len(config_json) < 10:
             return False
+        # The UI re-saves on every state change; skip the parse and write if nothing changed since our last
+        # save and the file on disk is still the one that save produced
+        digest = hashlib.blake2b(config_json.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        with self._lock:
+            if digest == self._last_saved_digest:
+                try:
+                    st = os.stat(CONFIG_FILE_STR)
+                    if (st.st_mtime_ns, st.st_size) == self._last_saved_stat:
+                        return True
+                except OSError:
+                    pass
         try:
-            with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-                f.write(config_json)
-            return True
-        except Exception as e:
-            print(f"[Engine] Error saving config: {e}")
+            parsed = json.loads(config_json)
+            # ensure_ascii keeps lone surrogates (e.g. a half-pasted emoji) as \u escapes, so this always encodes
+            content = json.dumps(parsed, separators=(',', ':'))
+            data = content.encode('ascii')
+        except ValueError as e:
+            logger.warning("Refusing to save invalid config: %s", e)
             return False
+        with self._lock:
+            self._invalidate_cache()
+            try:
+                st = _atomic_write(CONFIG_FILE_STR, data)
+                # Seed the cache with what we just wrote so the next load skips the read and parse
+                self._cache = content
+                self._cache_parsed = parsed
+                self._cache_stat = (st.st_mtime_ns, st.st_size)
+                self._last_saved_digest = digest
+                self._last_saved_stat = self._cache_stat
+                return True
+            except Exception as e:
+                logger.error("Error saving config: %s", e)
+                return False
 
     def export_config_dialog(self, config_json):
         """Native save file dialog for export using non-deprecated API."""
         if not self._window: return False
         try:
             # result can be a string or a list/tuple depending on version/OS
-            result = self._window.create_file_dialog(webview.FileDialog.SAVE, file_types=('JSON Files (*.json)',), save_filename='netconnect_backup.json')
+            result = self._window.create_file_dialog(_get_webview().FileDialog.SAVE, file_types=self._JSON_FILETYPES, save_filename='netconnect_backup.json')
             if result:
                 # result is expected to be a string or a sequence containing a string
                 save_path = result[0] if isinstance(result, (list, tuple)) else result
-                with open(save_path, 'w', encoding='utf-8') as f:
-                    f.write(config_json)
-                print(f"[Engine] Exported successfully to {save_path}")
+                _atomic_write(save_path, config_json.encode('utf-8'))
+                logger.info("Exported successfully to %s", save_path)
                 return True
         except Exception as e:
-            print(f"[Engine] Export failed: {e}")
+            logger.error("Export failed: %s", e)
             return False
         return False
 
@@ -67,119 +225,123 @@ class NetConnectAPI:
         """Native open file dialog for import using non-deprecated API."""
         if not self._window: return None
         try:
-            result = self._window.create_file_dialog(webview.FileDialog.OPEN, file_types=('JSON Files (*.json)',))
+            result = self._window.create_file_dialog(_get_webview().FileDialog.OPEN, file_types=self._JSON_FILETYPES)
             if result and len(result) > 0:
-                with open(result[0], 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    print(f"[Engine] Imported successfully from {result[0]}")
-                    return content
+                content = Path(result[0]).read_bytes().decode('utf-8')
+                logger.info("Imported successfully from %s", result[0])
+                return content
         except Exception as e:
-            print(f"[Engine] Import failed: {e}")
+            logger.error("Import failed: %s", e)
             return None
         return None
 
     def wipe_config(self):
         """Native factory reset - deletes the config file."""
-        if os.path.exists(CONFIG_FILE):
+        with self._lock:
+            self._invalidate_cache()
             try:
-                os.remove(CONFIG_FILE)
-                print("[Engine] Config file deleted (Factory Reset)")
+                os.remove(CONFIG_FILE_STR)
+                logger.info("Config file deleted (Factory Reset)")
+                return True
+            except FileNotFoundError:
                 return True
             except Exception as e:
-                print(f"[Engine] Wipe failed: {e}")
+                logger.error("Wipe failed: %s", e)
                 return False
-        return True
 
     def launch_rdp(self, host, username, password):
+        """Queues an RDP launch in the background; the outcome is reported via a 'netconnect:launch' event."""
+        self._submit("rdp", host, self._do_launch_rdp, host, username, password)
+        return True
+
+    def toggle_vpn(self, protocol, host, disconnect=False, sso=False):
+        """Queues a VPN client action in the background; the outcome is reported via a 'netconnect:launch' event."""
+        self._submit("vpn", host, self._do_toggle_vpn, protocol, host, disconnect, sso)
+        return True
+
+    def _submit(self, kind, target, fn, *args):
+        future = self._pool.submit(fn, *args)
+        future.add_done_callback(lambda f: self._notify_js(kind, target, f.exception() is None and f.result()))
+
+    def _notify_js(self, kind, target, ok):
+        """Dispatches a DOM event so the UI can react to a background launch finishing."""
+        if not self._window: return
+        detail = json.dumps({"kind": kind, "target": target, "ok": bool(ok)})
+        try:
+            self._window.evaluate_js(f"window.dispatchEvent(new CustomEvent('netconnect:launch', {{detail: {detail}}}))")
+        except Exception as e:
+            logger.warning("UI notify failed: %s", e)
+
+    def _do_launch_rdp(self, host, username, password):
         """Launches Windows MSTSC and injects credentials into the store temporarily."""
         try:
             if password:
-                targets = [host, f"TERMSRV/{host}"]
-                for target in targets:
-                    cmd = f'cmdkey /add:"{target}" /user:"{username}" /pass:"{password}"'
-                    subprocess.run(cmd, shell=True, capture_output=True, check=False)
-            subprocess.Popen(['mstsc', f'/v:{host}'])
+                # cmdkey is started directly: no cmd.exe in between and no shell quoting of the password
+                for target in (host, f"TERMSRV/{host}"):
+                    subprocess.run(
+                        ['cmdkey', f'/add:{target}', f'/user:{username}', f'/pass:{password}'],
+                        capture_output=True, check=False, **_NO_WINDOW
+                    )
+            subprocess.Popen(['mstsc', f'/v:{host}'], **_DETACHED)
             return True
         except Exception as e:
-            print(f"[Engine] Native RDP Error: {e}")
+            logger.error("Native RDP Error: %s", e)
             try:
-                subprocess.Popen(['mstsc', f'/v:{host}'])
+                subprocess.Popen(['mstsc', f'/v:{host}'], **_DETACHED)
             except:
                 pass
             return False
 
-    def toggle_vpn(self, protocol, host, disconnect=False, sso=False):
+    def _do_toggle_vpn(self, protocol, host, disconnect=False, sso=False):
         """Orchestrates different VPN client binaries based on protocol."""
         try:
             action = "disconnect" if disconnect else "connect"
-            print(f"[Engine] Toggling {protocol} for {host} (Action: {action}, SSO: {sso})")
-            
-            if protocol == "FortiClient":
-                cli_paths = [
-                    r"C:\Program Files\Fortinet\FortiClient\FortiSSLVPNcli.exe",
-                    r"C:\Program Files (x86)\Fortinet\FortiClient\FortiSSLVPNcli.exe"
-                ]
-                exe = next((p for p in cli_paths if os.path.exists(p)), None)
-                if exe and not sso:
-                    subprocess.Popen([exe, action, "-h", host])
-                    return True
-                gui = r"C:\Program Files\Fortinet\FortiClient\FortiClient.exe"
-                if os.path.exists(gui):
-                    subprocess.Popen([gui])
-                    return True
-
-            elif protocol == "OpenVPN":
-                exe = r"C:\Program Files\OpenVPN\bin\openvpn-gui.exe"
-                if os.path.exists(exe):
-                    cmd_action = "disconnect_all" if disconnect else "connect"
-                    subprocess.Popen([exe, "--command", cmd_action, host])
-                    return True
-
-            elif protocol == "Palo Alto GlobalProtect":
-                exe = r"C:\Program Files\Palo Alto Networks\GlobalProtect\PanGPA.exe"
-                if os.path.exists(exe):
-                    subprocess.Popen([exe])
-                    return True
-
-            elif protocol == "Cisco AnyConnect":
-                exe_paths = [
-                    r"C:\Program Files (x86)\Cisco\Cisco AnyConnect Secure Mobility Client\vpnui.exe",
-                    r"C:\Program Files (x86)\Cisco\Cisco Secure Client\vpnui.exe"
-                ]
-                exe = next((p for p in exe_paths if os.path.exists(p)), None)
-                if exe:
-                    subprocess.Popen([exe])
-                    return True
-
-            elif protocol == "Citrix":
-                exe = r"C:\Program Files (x86)\Citrix\ICA Client\SelfServicePlugin\SelfService.exe"
-                if os.path.exists(exe):
-                    subprocess.Popen([exe])
-                    return True
-
+            logger.info("Toggling %s for %s (Action: %s, SSO: %s)", protocol, host, action, sso)
+            handler = self._handlers.get(protocol)
+            if handler:
+                handler(protocol, host, disconnect, sso)
             return True
         except Exception as e:
-            print(f"[Engine] VPN Native Error: {e}")
+            logger.error("VPN Native Error: %s", e)
             return False
 
+    def _run_forticlient(self, protocol, host, disconnect, sso):
+        bins = _resolve(protocol)
+        if bins["cli"] and not sso:
+            action = "disconnect" if disconnect else "connect"
+            subprocess.Popen([bins["cli"], action, "-h", host])
+        elif bins["gui"]:
+            subprocess.Popen([bins["gui"]])
+
+    def _run_openvpn(self, protocol, host, disconnect, sso):
+        exe = _resolve(protocol)["gui"]
+        if exe:
+            cmd_action = "disconnect_all" if disconnect else "connect"
+            subprocess.Popen([exe, "--command", cmd_action, host])
+
+    def _run_gui_client(self, protocol, host, disconnect, sso):
+        """Clients without a usable CLI: bring up their UI and let the user drive it."""
+        exe = _resolve(protocol)["gui"]
+        if exe:
+            subprocess.Popen([exe])
+
 def start_app():
+    import mimetypes
+    webview = _get_webview()
+
+    # Fix MIME types for ES6 modules
+    mimetypes.add_type('application/javascript', '.ts')
+    mimetypes.add_type('application/javascript', '.tsx')
+
     api = NetConnectAPI()
-    template_dir = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
-    index_path = os.path.join(template_dir, 'index.html')
 
-    # Load initial config to check for devtools flag
-    show_debug = False
-    if os.path.exists(CONFIG_FILE):
-        try:
-            with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                cfg = json.loads(f.read())
-                show_debug = cfg.get('showDevTools', False)
-        except:
-            pass
+    # Load initial config to check for devtools flag; this also warms the API's config cache
+    cfg = api.get_parsed_config()
+    show_debug = cfg.get('showDevTools', False) if isinstance(cfg, dict) else False
 
     window = webview.create_window(
         'NetConnect Pro Console',
-        url=index_path,
+        url=INDEX_PATH,
         js_api=api,
         width=1280,
         height=900,
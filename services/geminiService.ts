@@ -26,52 +26,52 @@ export const getSmartConfigHelp = async (connection: Connection) => {
   }
 };
 
+// Settings shared by every generated .rdp file; only the address and username vary per connection
+const RDP_STATIC_SETTINGS = [
+  'screen mode id:i:2',
+  'use multimon:i:0',
+  'desktopwidth:i:1920',
+  'desktopheight:i:1080',
+  'session bpp:i:32',
+  'winposstr:s:0,3,0,0,800,600',
+  'compression:i:1',
+  'keyboardhook:i:2',
+  'audiocapturemode:i:0',
+  'videoplaybackmode:i:1',
+  'connection type:i:7',
+  'displayconnectionbar:i:1',
+  'shell working directory:s:',
+  'disable wallpaper:i:1',
+  'disable full window drag:i:1',
+  'disable menu anims:i:1',
+  'disable themes:i:0',
+  'disable cursor setting:i:0',
+  'bitmapcachepersistenable:i:1',
+  'audiomode:i:0',
+  'redirectprinters:i:1',
+  'redirectcomports:i:0',
+  'redirectsmartcards:i:1',
+  'redirectclipboard:i:1',
+  'redirectposdevices:i:0',
+  'autoreconnection enabled:i:1',
+  'authentication level:i:2',
+  'prompt for credentials:i:1',
+  'negotiate security layer:i:1',
+  'remoteapplicationmode:i:0',
+  'alternate shell:s:',
+  'gatewayhostname:s:',
+  'gatewayusagemethod:i:4',
+  'gatewaycredentialssource:i:4',
+  'gatewayprofileusagemethod:i:0',
+  'promptcredentialonce:i:1',
+  'use redirection server name:i:0',
+  'rdgiskdcproxy:i:0',
+  'kdcproxyname:s:',
+].join('\n');
+
 // Updated generateRdpFile to accept an optional username, defaulting to Administrator
 export const generateRdpFile = (connection: Connection, username: string = 'Administrator') => {
-  const content = `
-screen mode id:i:2
-use multimon:i:0
-desktopwidth:i:1920
-desktopheight:i:1080
-session bpp:i:32
-winposstr:s:0,3,0,0,800,600
-full address:s:${connection.host}
-compression:i:1
-keyboardhook:i:2
-audiocapturemode:i:0
-videoplaybackmode:i:1
-connection type:i:7
-displayconnectionbar:i:1
-username:s:${username}
-shell working directory:s:
-disable wallpaper:i:1
-disable full window drag:i:1
-disable menu anims:i:1
-disable themes:i:0
-disable cursor setting:i:0
-bitmapcachepersistenable:i:1
-audiomode:i:0
-redirectprinters:i:1
-redirectcomports:i:0
-redirectsmartcards:i:1
-redirectclipboard:i:1
-redirectposdevices:i:0
-autoreconnection enabled:i:1
-authentication level:i:2
-prompt for credentials:i:1
-negotiate security layer:i:1
-remoteapplicationmode:i:0
-alternate shell:s:
-shell working directory:s:
-gatewayhostname:s:
-gatewayusagemethod:i:4
-gatewaycredentialssource:i:4
-gatewayprofileusagemethod:i:0
-promptcredentialonce:i:1
-use redirection server name:i:0
-rdgiskdcproxy:i:0
-kdcproxyname:s:
-  `.trim();
+  const content = `full address:s:${connection.host}\nusername:s:${username}\n${RDP_STATIC_SETTINGS}`;
   
   const blob = new Blob([content], { type: 'application/rdp' });
   const url = URL.createObjectURL(blob);